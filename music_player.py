@@ -4,19 +4,19 @@ This code creates a hand gesture-controlled music player system that combines:
 2. MediaPipe's AI hand tracking for gesture recognition
 3. Pygame for music playback functionality
 4. Windows audio APIs for system volume control
-5. Mathematical calculations for gesture interpretation
+5. Mathematical calculations for gesture interpretation (numpy)
 
 Key components enabled by the libraries:
 - Real-time hand tracking (mediapipe)
 - Music playlist management (pygame + os)
 - System-level volume adjustment (pycaw + ctypes)
 - Visual interface (cv2)
-- Gesture timing controls (time)
+- Gesture timing controls (time, monotonic nanosecond clock)
+- Camera / AI / display running side by side (threading + queue)
 """
 
 import cv2
 import pygame
-import math
 import numpy as np
 import mediapipe as mp
 from ctypes import cast, POINTER
@@ -24,8 +24,14 @@ from comtypes import CLSCTX_ALL
 from pycaw.pycaw import AudioUtilities, IAudioEndpointVolume
 import os
 import time
+import queue
+import threading
+from collections import namedtuple
 
 # Initialize pygame mixer
+# (44.1kHz, 16-bit stereo, big 4096-sample buffer so the audio doesn't pop
+# while MediaPipe is hogging the CPU, ~90ms of latency nobody will notice)
+pygame.mixer.pre_init(44100, -16, 2, 4096)
 pygame.mixer.init()
 
 # ===========================================
@@ -38,14 +44,17 @@ pygame.mixer.init()
 songs_folder = "songs"  # Your personal DJ booth directory
 
 # Hunt down all MP3 files like a music detective
-music_files = [
-    os.path.join(songs_folder, f)  # Build full file paths
-    for f in os.listdir(songs_folder)  # Check every file
-    if f.endswith(".mp3")  # Only grab actual music files
-]
-
 # Alphabetical order because chaos is bad for playlists
-music_files.sort()  # A-B-C sorting for your tracks
+# (sorting the short names is cheaper than sorting full paths)
+with os.scandir(songs_folder) as entries:  # Check every file
+    names = sorted(
+        e.name for e in entries
+        if e.is_file() and e.name.lower().endswith(".mp3")  # Only grab actual music files
+    )
+music_files = [os.path.join(songs_folder, n) for n in names]  # Build full file paths
+
+if not music_files:
+    raise SystemExit(f'No MP3s found in "{songs_folder}" - add some songs and try again!')
 
 # --- Jukebox Setup ---
 current_song_index = 0  # Start with the first track
@@ -72,6 +81,14 @@ volume = cast(interface, POINTER(IAudioEndpointVolume))
 volRange = volume.GetVolumeRange()  # How quiet/loud can we go?
 minVol, maxVol = volRange[0], volRange[1]  # Usually -65.25db (silent) to 0db (BOOM)
 
+# Step 5: Work out the straight-line conversions once
+# (pinch = 0.0 closed to 1.0 wide open, see PINCH_LUT further down)
+VOL_SLOPE, VOL_INTER = maxVol - minVol, minVol  # pinch -> Windows dB
+BAR_SLOPE, BAR_INTER = -250.0, 400.0  # pinch -> bar fill top (400 = empty, 150 = full)
+PCT_SLOPE = 100.0  # pinch -> human %
+DB_PCT_SLOPE = 100.0 / (maxVol - minVol)  # Windows dB -> human %
+DB_PCT_INTER = -minVol * DB_PCT_SLOPE
+
 """
 Real Talk:
 1. The music loading is like making a mixtape:
@@ -84,7 +101,7 @@ Real Talk:
    (This lets our gestures control your actual system volume later)
 
 Watch Out For:
-- No MP3s in "songs" folder? This code will cry
+- No MP3s in "songs" folder? The program tells you and quits
 - Weird volume math later because Windows uses decibels (-65.25 to 0)
 - Pygame needs to be initialized first (which we did earlier)
 """
@@ -94,34 +111,170 @@ Watch Out For:
 # ===========================================
 
 # --- Magic Hand Tracking Setup ---
-mp_hands = mp.solutions.hands  # Google's secret hand sauce
-mp_drawing = mp.solutions.drawing_utils  # Tools to draw hand skeletons
-hands = mp_hands.Hands(
-    static_image_mode=False,  # Using video
-    max_num_hands=2,  # "I can handle two hands... but not a zombie apocalypse"
-    min_detection_confidence=0.5,  # "I need to be 50% sure it's a hand"
-    min_tracking_confidence=0.5  # "I'll keep tracking unless I get confused"
-)
+BaseOptions = mp.tasks.BaseOptions
+HandLandmarker = mp.tasks.vision.HandLandmarker
+HandLandmarkerOptions = mp.tasks.vision.HandLandmarkerOptions
+VisionRunningMode = mp.tasks.vision.RunningMode
+
+# MediaPipe answers on its own thread, we just keep the newest answer around
+latest_result = None
+result_lock = threading.Lock()
+
+
+def on_result(result, output_image, timestamp_ms):
+    global latest_result
+    with result_lock:
+        latest_result = result
+
+
+def create_hand_tracker(delegate):
+    return HandLandmarker.create_from_options(HandLandmarkerOptions(
+        base_options=BaseOptions(
+            model_asset_path="hand_landmarker.task",  # The hand model (see README)
+            delegate=delegate  # Who runs the AI: GPU or CPU
+        ),
+        running_mode=VisionRunningMode.LIVE_STREAM,  # Using video, answers come back async
+        num_hands=2,  # "I can handle two hands... but not a zombie apocalypse"
+        min_hand_detection_confidence=0.5,  # "I need to be 50% sure it's a hand"
+        min_hand_presence_confidence=0.5,
+        min_tracking_confidence=0.5,  # "I'll keep tracking unless I get confused"
+        result_callback=on_result
+    ))
+
+
+# Try the graphics card first (faster), fall back to the CPU if it says no
+try:
+    hands = create_hand_tracker(BaseOptions.Delegate.GPU)
+except (RuntimeError, NotImplementedError) as e:
+    print(f"GPU hand tracking not available ({e}), using the CPU instead")
+    hands = create_hand_tracker(BaseOptions.Delegate.CPU)
 
 # --- Webcam Setup ---
-cap = cv2.VideoCapture(0)  # Use the main webcam
+cap = cv2.VideoCapture(0, cv2.CAP_DSHOW)  # Use the main webcam (DirectShow, MSMF likes to stall on read())
+cap.set(cv2.CAP_PROP_BUFFERSIZE, 1)  # Don't let old frames pile up inside the driver
 wCam, hCam = 640, 480  # "640x480 resolution
+cap.set(cv2.CAP_PROP_FOURCC, cv2.VideoWriter_fourcc(*'MJPG'))  # Ask for compressed frames (less USB traffic)
 cap.set(3, wCam)  # Set width
 cap.set(4, hCam)  # Set height
 
+# --- Hand Skeleton Drawing ---
+# MediaPipe's 21 hand connections as 6 connected chains, so the whole
+# skeleton is one cv2.polylines call instead of a line per bone
+FINGER_CHAINS = [
+    [0, 1, 2, 3, 4],  # Thumb
+    [0, 5, 6, 7, 8],  # Index
+    [9, 10, 11, 12],  # Middle
+    [13, 14, 15, 16],  # Ring
+    [0, 17, 18, 19, 20],  # Pinky
+    [5, 9, 13, 17],  # Across the palm
+]
+show_skeleton = True  # Press "s" to hide/show it
+
+
+def draw_hands(frame, hands_lm, lm_to_pixels):
+    # All hands in one go: (hands, 21, 3) landmarks -> (hands, 21, 2) pixels
+    pts = (hands_lm[:, :, :2] * lm_to_pixels).astype(np.int32)
+    cv2.polylines(frame, [hand[chain] for hand in pts for chain in FINGER_CHAINS], False, (224, 224, 224), 2)  # Bones
+    for x, y in pts.reshape(-1, 2).tolist():
+        cv2.circle(frame, (x, y), 2, (0, 0, 255), 2)  # Joints
+
+
+# --- Volume Bar Outline ---
+# The outline never changes, so draw it once into a small patch and just
+# copy its green pixels onto the frame with cv2.copyTo (only the fill is drawn per frame)
+BAR_X0, BAR_Y0, BAR_X1, BAR_Y1 = 45, 145, 91, 406  # Patch around (50,150)-(85,400) + line width
+BAR_OVERLAY = np.zeros((BAR_Y1 - BAR_Y0, BAR_X1 - BAR_X0, 3), dtype=np.uint8)
+cv2.rectangle(BAR_OVERLAY, (50 - BAR_X0, 150 - BAR_Y0), (85 - BAR_X0, 400 - BAR_Y0), (0, 255, 0), 3)
+BAR_MASK = BAR_OVERLAY.any(axis=2).astype(np.uint8)  # 1 = outline pixel
+
+
+def clip_patch(frame, x, y, patch):
+    # Which part of the frame a patch pasted at (x, y) covers, and which part of
+    # the patch that is (cameras that ignore 640x480 give us smaller frames)
+    frame_h, frame_w = frame.shape[:2]
+    patch_h, patch_w = patch.shape[:2]
+    x0, y0 = max(x, 0), max(y, 0)
+    x1, y1 = min(x + patch_w, frame_w), min(y + patch_h, frame_h)
+    if x0 >= x1 or y0 >= y1:
+        return None  # Completely off screen
+    return (slice(y0, y1), slice(x0, x1)), (slice(y0 - y, y1 - y), slice(x0 - x, x1 - x))
+
+
+def draw_volume_bar(frame, vol_bar):
+    region = clip_patch(frame, BAR_X0, BAR_Y0, BAR_OVERLAY)
+    if region is not None:
+        on_frame, on_patch = region
+        cv2.copyTo(BAR_OVERLAY[on_patch], BAR_MASK[on_patch], frame[on_frame])  # Bar outline
+    cv2.rectangle(frame, (50, int(vol_bar)), (85, 400), (0, 255, 0), cv2.FILLED)  # Fill it
+
+
+# --- On-Screen Text Stickers ---
+# There are only 4 messages and 101 volume readings, so write each one
+# once at startup and just paste it onto the frame later
+def render_text(text, font, color=(0, 255, 0), scale=1, thickness=2):
+    (w, h), baseline = cv2.getTextSize(text, font, scale, thickness)
+    pad = 2 * thickness  # Room for the stroke width
+    ink = np.zeros((h + baseline + 2 * pad, w + 2 * pad), dtype=np.uint8)
+    cv2.putText(ink, text, (pad, h + pad), font, scale, 255, thickness)  # How much ink each pixel got
+    ys, xs = np.nonzero(ink)
+    top, left = ys.min(), xs.min()
+    ink = ink[top:ys.max() + 1, left:xs.max() + 1]  # Trim the empty border
+    keep = cv2.merge([255 - ink] * 3)  # How much background shows through (255 = all of it)
+    paint = np.rint(ink[:, :, None] * (np.float32(color) / 255)).astype(np.uint8)  # The ink itself, in color
+    # Sticker, plus how far it sits from putText's (x, y) anchor
+    return keep, paint, left - pad, top - (h + pad)
+
+
+def blit_sprite(frame, sprite, x, y):
+    keep, paint, dx, dy = sprite
+    region = clip_patch(frame, x + dx, y + dy, keep)
+    if region is None:
+        return  # Text would land completely off screen
+    on_frame, on_patch = region
+    roi = frame[on_frame]
+    cv2.multiply(roi, keep[on_patch], roi, scale=1 / 255)  # Fade the background under the ink
+    cv2.add(roi, paint[on_patch], roi)  # Then lay the ink on top
+
+
+MSG_SPRITES = {m: render_text(m, cv2.FONT_HERSHEY_SIMPLEX)
+               for m in ["Next Song", "Previous Song", "Paused", "Playing"]}
+VOL_SPRITES = [render_text(f'Volume: {p}%', cv2.FONT_HERSHEY_COMPLEX) for p in range(101)]
+
 # ===========================================
 # PART 4: THE PROGRAM'S BRAIN (MEMORY VARIABLES)
 # ===========================================
 
 # Volume Memory
 last_volume = volume.GetMasterVolumeLevel()  # "Remember where we left the volume"
+# Talking to Windows is slow, so only do it when the volume really changed:
+# a 1dB+ jump goes out right away, smaller nudges at most every 50ms
+last_set_volume = last_volume  # What Windows actually has right now
+last_vol_set_ns = 0
+VOLUME_STEP_DB = 0.5  # Volume moves in 0.5dB steps
+VOLUME_SET_INTERVAL = 50_000_000  # 50ms (in ns, like the cooldowns below)
+
+# Pinch opening (0.0 = 30px apart, 1.0 = 250px+) looked up by the *squared*
+# pixel distance, so the volume math never takes a square root
+PINCH_MAX_D2 = 250 * 250
+PINCH_LUT = np.clip((np.sqrt(np.arange(PINCH_MAX_D2 + 1)) - 30) / 220, 0.0, 1.0).tolist()
 
 # Gesture cooldown (Prevent Spam)
-cooldown_time = 1.0  # 1-second timeout
-last_wave_time = 0
+# All times are time.monotonic_ns() nanoseconds (never jumps, plain int compares)
+cooldown_time = 1_000_000_000  # 1-second timeout
+wave_cooldown_until = 0  # Also read by the camera thread to know when it can take it easy
+
+# MediaPipe Breaks
+# While waves are cooling down nothing but the pinch can fire, so if we're
+# already tracking a hand, only ask MediaPipe about every Nth frame
+COOLDOWN_DETECT_EVERY = 2
+
+# Frame Pacing
+# Aim for 30 FPS and spend whatever is left of each frame waiting for keys,
+# instead of racing around the loop and eating CPU MediaPipe could use
+FRAME_INTERVAL = 1_000_000_000 // 30  # ~33ms per frame
 
 # On-Screen Messages
-message_duration = 1
+message_duration = 1_000_000_000  # 1 second
 current_message = ""
 message_start_time = 0
 
@@ -129,16 +282,24 @@ message_start_time = 0
 Key Explanations:
 1. Hand Tracking:
 - Google's MediaPipe does the heavy lifting 
-- static_image_mode=False = Optimized for video (not photos)
+- LIVE_STREAM mode = Optimized for video (not photos), it only re-runs the
+  palm detector when it loses track of the hand
+- detect_async() returns right away, the answer shows up later in on_result()
 - Confidence levels = How sure the AI needs to be (0.5 = 50% sure)
+- GPU delegate = The graphics card runs the AI models when it can
+  (not every platform supports it, then the CPU takes over)
 
 2. Camera Setup:
 - 0 = Default webcam (change to 1 if you have multiple cameras)
+- The camera has its own thread, so a slow read() never freezes the window,
+  the main loop just picks up the newest frame waiting in frame_queue
 - 640x480 = Sweet spot between quality and speed
 
 3. Why Cooldowns?:
 - Prevents accidental "next song" spam when waving
 - Like a refractory period for gestures
+- Also a free break for MediaPipe: the last hand it saw gets reused
+  on the frames it skips
 """
 
 '''
@@ -161,47 +322,78 @@ Gesture Cheat Sheet:
   - Lower y value = higher up on screen
 - MediaPipe hand landmarks are like finger GPS 
   (21 points per hand, 0 = wrist, 4 = thumb tip)
+- We keep them as small whole numbers: 1.0 (full frame) = 2048,
+  so 0.1 of the frame = 205 and every check is a quick integer compare
 '''
 
 
-def is_wave_left(landmarks):
-    wrist = landmarks.landmark[0]    # its like de anchor point of the hand
-    finger_tips = [landmarks.landmark[i] for i in [4, 8, 12, 16, 20]]  # The numbers represent all fingertips
-    return all(tip.x < wrist.x - 0.1 for tip in finger_tips)  # all fingertips to the left of the wrist
+# Fingertip indices (thumb, index, middle, ring, pinky)
+FINGER_TIPS = [4, 8, 12, 16, 20]
 
+# Fixed-point landmarks (int16, 1.0 = LM_SCALE)
+LM_SCALE = 2048
+WAVE_DELTA = round(0.1 * LM_SCALE)  # How far past the wrist counts as a wave
+OK_DISTANCE2 = round((0.05 * LM_SCALE) ** 2)  # Thumb-index "touching", squared
 
-def is_wave_right(landmarks):
-    wrist = landmarks.landmark[0]
-    finger_tips = [landmarks.landmark[i] for i in [4, 8, 12, 16, 20]]
-    return all(tip.x > wrist.x + 0.1 for tip in finger_tips)  # all fingertips to the right of the wrist
 
+def hands_to_array(hand_landmarks):
+    # Copy every hand's 21 landmarks into one (hands, 21, 3) int16 array per frame,
+    # so the gesture checks below are plain NumPy slices instead of ~25 attribute lookups per hand
+    # (normalized coords hover around 0..1, nowhere near int16's +-16 at this scale)
+    return (np.fromiter(
+        (v for hand in hand_landmarks for p in hand for v in (p.x, p.y, p.z)),
+        dtype=np.float32, count=63 * len(hand_landmarks)
+    ) * LM_SCALE).astype(np.int16).reshape(-1, 21, 3)
 
-def is_volume_control_gesture(landmarks):
-    index_up = landmarks.landmark[8].y < landmarks.landmark[6].y  # index finger straight up
-    thumb_up = landmarks.landmark[4].x < landmarks.landmark[3].x
 
-    middle_down = landmarks.landmark[12].y > landmarks.landmark[10].y
-    ring_down = landmarks.landmark[16].y > landmarks.landmark[14].y
-    pinky_down = landmarks.landmark[20].y > landmarks.landmark[18].y
-    return index_up and thumb_up and middle_down and ring_down and pinky_down  # "Pinch" sign
+# --- Math Helper ---
+def hypot2(dx, dy):
+    return dx * dx + dy * dy  # Squared distance, no square root needed for comparisons
+
+
+# Everything the gestures need, computed once per frame
+# (each field holds one True/False or number per hand)
+GestureFeatures = namedtuple("GestureFeatures", [
+    "index_up", "middle_up", "ring_up", "pinky_up",  # tip above its middle joint
+    "thumb_left_of_ip",  # thumb tip left of its joint
+    "tips_left", "tips_right",  # all fingertips past the wrist
+    "ok_distance2",  # thumb tip <-> index tip, squared
+])
 
-#  for the ok sign
-last_gesture_time = 0
-gesture_cooldown = 1
-def is_play_pause_gesture(landmarks):
-    # Check for "OK" gesture (thumb and index touching, other fingers extended)
-    thumb_tip = landmarks.landmark[4]
-    index_tip = landmarks.landmark[8]
 
-    # Check distance between thumb and index (touching)
-    distance = math.hypot(thumb_tip.x - index_tip.x, thumb_tip.y - index_tip.y)
+def compute_features(hands_lm):
+    tips_x = hands_lm[:, FINGER_TIPS, 0]
+    wrist_x = hands_lm[:, 0:1, 0]  # its like de anchor point of the hand
+    up = hands_lm[:, [8, 12, 16, 20], 1] < hands_lm[:, [6, 10, 14, 18], 1]
+    # (int32 here, a squared int16 would overflow)
+    thumb_to_index = hands_lm[:, 4, :2].astype(np.int32) - hands_lm[:, 8, :2]
+    return GestureFeatures(
+        up[:, 0], up[:, 1], up[:, 2], up[:, 3],
+        hands_lm[:, 4, 0] < hands_lm[:, 3, 0],
+        np.all(tips_x < wrist_x - WAVE_DELTA, axis=1),
+        np.all(tips_x > wrist_x + WAVE_DELTA, axis=1),
+        hypot2(thumb_to_index[:, 0], thumb_to_index[:, 1]),
+    )
 
-    # Check other fingers are extended
-    middle_up = landmarks.landmark[12].y < landmarks.landmark[10].y
-    ring_up = landmarks.landmark[16].y < landmarks.landmark[14].y
-    pinky_up = landmarks.landmark[20].y < landmarks.landmark[18].y
 
-    return distance < 0.05 and middle_up and ring_up and pinky_up # Ok sign
+def is_wave_left(f):
+    return f.tips_left  # all fingertips to the left of the wrist
+
+
+def is_wave_right(f):
+    return f.tips_right  # all fingertips to the right of the wrist
+
+
+def is_volume_control_gesture(f):
+    # index and thumb up, middle/ring/pinky down
+    return f.index_up & f.thumb_left_of_ip & ~(f.middle_up | f.ring_up | f.pinky_up)  # "Pinch" sign
+
+#  for the ok sign
+gesture_cooldown = 1_000_000_000
+play_pause_cooldown_until = 0
+def is_play_pause_gesture(f):
+    # Check for "OK" gesture (thumb and index touching, other fingers extended)
+    return (f.ok_distance2 < OK_DISTANCE2) & f.middle_up & f.ring_up & f.pinky_up  # Ok sign
 
 
 print("Guideline:\n")
@@ -209,121 +401,215 @@ print(" - Wave left (right hand) → Next song")
 print(" - Wave right (left hand) → Previous song")
 print(" - Pinch gesture (right hand) → Control volume")
 print(" - OK gesture (thumb+index touch) → Play/Pause")
+print(" - Press S → Hide/show the hand skeleton, Q → Quit")
 
 # ===========================================
 # PART 6: THE MAIN SHOW! (Where Magic Happens)
 # ===========================================
 
-while True:
-    # Step 1: Check webcam feed
-    success, frame = cap.read()
-    if not success:
-        break
-
-    # Mirror mode to help with the comprehension
-    frame = cv2.flip(frame, 1)  # 1 = "Make me look good in selfies"
+# --- Assembly Line (3 workers, each doing one job) ---
+# Camera thread: grab + mirror + RGB
+# MediaPipe's own thread: find the hands (answers land in on_result)
+# Main thread (this one): draw, music and volume (pygame and pycaw stay here,
+# the Windows audio COM objects don't like being touched from other threads)
+# The queue only holds the newest frame, so a slow stage never builds a backlog
+frame_queue = queue.Queue(maxsize=1)
+running = threading.Event()
+running.set()
+capture_error = None  # Whatever crashed the camera thread, raised again after cleanup
+
+
+def put_latest(q, item):
+    # Throw away the old item (if nobody took it yet) and put the fresh one
+    try:
+        q.get_nowait()
+    except queue.Empty:
+        pass
+    q.put_nowait(item)
+
+
+def capture_loop():
+    global capture_error
+    last_timestamp_ms = -1
+    frames_since_detect = 0
+    rgb_buf = np.empty((hCam, wCam, 3), dtype=np.uint8)  # Reused every frame instead of a new ~900KB array
+    try:
+        while running.is_set():
+            # Step 1: Check webcam feed
+            success, frame = cap.read()
+            if not success:
+                break
+
+            # Mirror mode to help with the comprehension
+            frame = cv2.flip(frame, 1)  # 1 = "Make me look good in selfies"
+
+            # Cooling down and still seeing the hand? Skip MediaPipe on this one
+            with result_lock:
+                tracking = latest_result is not None and bool(latest_result.hand_landmarks)
+            if tracking and time.monotonic_ns() < wave_cooldown_until and frames_since_detect + 1 < COOLDOWN_DETECT_EVERY:
+                frames_since_detect += 1
+                put_latest(frame_queue, frame)
+                continue
+            frames_since_detect = 0
+
+            # MediaPipe needs RGB colors
+            # (mp.Image keeps its own copy, so the same buffer can be refilled next frame)
+            frame_rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB, dst=rgb_buf)
+
+            # Ask MediaPipe: "Do you see hands in this frame?"
+            # (timestamps have to keep going up, even if two frames land in the same ms)
+            timestamp_ms = max(time.monotonic_ns() // 1_000_000, last_timestamp_ms + 1)
+            last_timestamp_ms = timestamp_ms
+            hands.detect_async(mp.Image(image_format=mp.ImageFormat.SRGB, data=frame_rgb), timestamp_ms)
+            put_latest(frame_queue, frame)
+    except Exception as e:
+        capture_error = e  # Hand the crash over to the main thread so it can report it
+    finally:
+        put_latest(frame_queue, None)  # "No more frames, folks" (even if something broke)
+
+
+capture_thread = threading.Thread(target=capture_loop, daemon=True)
+capture_thread.start()
 
-    # MediaPipe needs RGB colors
-    frame_rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
+while True:
+    # Wait for the next camera frame
+    frame = frame_queue.get()
+    if frame is None:
+        break  # Camera is gone
 
-    # Ask MediaPipe: "Do you see hands in this frame?"
-    results = hands.process(frame_rgb)
+    # Grab whatever MediaPipe found most recently
+    with result_lock:
+        results = latest_result
 
     # Convert Windows' volume range to human % (0-100)
-    volPer = int(np.interp(last_volume, [minVol, maxVol], [0, 100]))
+    volPer = int(min(max(DB_PCT_SLOPE * last_volume + DB_PCT_INTER, 0.0), 100.0))
     volume_gesture_active = False  # Volume control not active... yet
-    current_time = time.time()
+    now = time.monotonic_ns()  # One clock read per frame
+    frame_deadline = now + FRAME_INTERVAL
+
+    # Waves still cooling down? Then none of the wave/OK checks can fire this frame
+    waves_ready = now >= wave_cooldown_until
 
     # If hands detected
-    if results.multi_hand_landmarks and results.multi_handedness:
-        for hand_landmark, hand_handedness in zip(results.multi_hand_landmarks, results.multi_handedness):
-            # Draw hand connections
-            mp_drawing.draw_landmarks(frame, hand_landmark, mp_hands.HAND_CONNECTIONS)
-
-            # Wave detection (with cooldown to prevent DJ spam)
-            if current_time - last_wave_time > cooldown_time:
-                # Next song trigger, the first music will start when you trigger this, and then you can use it normally
-                if is_wave_left(hand_landmark):
-                    current_song_index = (current_song_index + 1) % len(music_files) #to prevent errors
-                    pygame.mixer.music.load(music_files[current_song_index])
-                    pygame.mixer.music.play()
-                    current_message = "Next Song"
-                    message_start_time = current_time
-                    last_wave_time = current_time
-
-                # Previous song trigger
-                elif is_wave_right(hand_landmark):
-                    current_song_index = (current_song_index - 1) % len(music_files)
-                    pygame.mixer.music.load(music_files[current_song_index])
-                    pygame.mixer.music.play()
-                    current_message = "Previous Song"
-                    message_start_time = current_time
-                    last_wave_time = current_time
-
-                # Play/Pause trigger
-                elif is_play_pause_gesture(hand_landmark) and (current_time - last_gesture_time) > gesture_cooldown:
-                    if pygame.mixer.music.get_busy(): #if the music IS PLAYING
-                        pygame.mixer.music.pause()
-                        current_message = "Paused"
-                    else:
-                        pygame.mixer.music.unpause()
-                        current_message = "Playing"
-                    message_start_time = current_time
-                    last_gesture_time = current_time
-
-            # Volume control section 🔊
-            if is_volume_control_gesture(hand_landmark):
-                volume_gesture_active = True
-                h, w, _ = frame.shape  # Get screen dimensions
-
-                # Get thumb and index positions (the volume tweezers)
-                thumb = hand_landmark.landmark[4]
-                index = hand_landmark.landmark[8]
-                thumb_x, thumb_y = int(thumb.x * w), int(thumb.y * h)
-                index_x, index_y = int(index.x * w), int(index.y * h)
-
-                # Draw UI elements (because style matters)
-                cv2.circle(frame, (thumb_x, thumb_y), 15, (255, 0, 255), cv2.FILLED)  # Purple thumb
-                cv2.circle(frame, (index_x, index_y), 15, (255, 0, 255), cv2.FILLED)  # Purple index
-                cv2.line(frame, (thumb_x, thumb_y), (index_x, index_y), (255, 0, 255), 3)  # Connect them
-
-                # Math magic to convert finger distance to volume
-                length = math.hypot(index_x - thumb_x, index_y - thumb_y)
-                new_volume = np.interp(length, [30, 250], [minVol, maxVol])  # Scale it!
-                last_volume = new_volume
+    if results is not None and results.hand_landmarks:
+        # One bulk copy of every hand's landmarks, (hands, 21, 3), every check below reads from it
+        hands_lm = hands_to_array(results.hand_landmarks)
+
+        # Landmark units -> pixels of *this* frame (the camera may not give us 640x480)
+        lm_to_pixels = np.array(frame.shape[1::-1], dtype=np.float32) / LM_SCALE
+
+        # Draw hand connections
+        if show_skeleton:
+            draw_hands(frame, hands_lm, lm_to_pixels)
+
+        # Each check answers for all hands at once (one True/False per hand)
+        features = compute_features(hands_lm)
+        wave_left = is_wave_left(features)
+
+        # Wave detection (with cooldown to prevent DJ spam)
+        if waves_ready:
+            # Next song trigger, the first music will start when you trigger this, and then you can use it normally
+            if wave_left.any():
+                current_song_index = (current_song_index + 1) % len(music_files) #to prevent errors
+                pygame.mixer.music.load(music_files[current_song_index])
+                pygame.mixer.music.play()
+                current_message = "Next Song"
+                message_start_time = now
+                wave_cooldown_until = now + cooldown_time
+
+            # Previous song trigger
+            elif is_wave_right(features).any():
+                current_song_index = (current_song_index - 1) % len(music_files)
+                pygame.mixer.music.load(music_files[current_song_index])
+                pygame.mixer.music.play()
+                current_message = "Previous Song"
+                message_start_time = now
+                wave_cooldown_until = now + cooldown_time
+
+            # Play/Pause trigger
+            elif now >= play_pause_cooldown_until and is_play_pause_gesture(features).any():
+                if pygame.mixer.music.get_busy(): #if the music IS PLAYING
+                    pygame.mixer.music.pause()
+                    current_message = "Paused"
+                else:
+                    pygame.mixer.music.unpause()
+                    current_message = "Playing"
+                message_start_time = now
+                play_pause_cooldown_until = now + gesture_cooldown
+
+        # Volume control section 🔊
+        # (a left-waving hand can't be pinching, and the first pinching hand wins)
+        pinching = np.flatnonzero(is_volume_control_gesture(features) & ~wave_left)
+        if pinching.size:
+            volume_gesture_active = True
+            lm = hands_lm[pinching[0]]
+
+            # Get thumb and index positions (the volume tweezers), in pixels
+            (thumb_x, thumb_y), (index_x, index_y) = (lm[[4, 8], :2] * lm_to_pixels).astype(np.int32).tolist()
+
+            # Draw UI elements (because style matters)
+            cv2.circle(frame, (thumb_x, thumb_y), 15, (255, 0, 255), cv2.FILLED)  # Purple thumb
+            cv2.circle(frame, (index_x, index_y), 15, (255, 0, 255), cv2.FILLED)  # Purple index
+            cv2.line(frame, (thumb_x, thumb_y), (index_x, index_y), (255, 0, 255), 3)  # Connect them
+
+            # Math magic to convert finger distance to volume
+            pinch = PINCH_LUT[min(hypot2(index_x - thumb_x, index_y - thumb_y), PINCH_MAX_D2)]
+            new_volume = VOL_SLOPE * pinch + VOL_INTER  # Scale it!
+            volBar = BAR_SLOPE * pinch + BAR_INTER
+            volPer = int(PCT_SLOPE * pinch)
+            new_volume = min(max(round(new_volume / VOLUME_STEP_DB) * VOLUME_STEP_DB, minVol), maxVol)
+            last_volume = new_volume
+            if new_volume != last_set_volume and (
+                    abs(new_volume - last_set_volume) > VOLUME_STEP_DB
+                    or now - last_vol_set_ns > VOLUME_SET_INTERVAL):
                 volume.SetMasterVolumeLevel(new_volume, None)  # LOUDER PLEASE!
+                last_set_volume = new_volume
+                last_vol_set_ns = now
+
+    # Pinch let go before the last small nudge went out? Send it now,
+    # so Windows ends up at the same volume we show on screen
+    if not volume_gesture_active and last_volume != last_set_volume:
+        volume.SetMasterVolumeLevel(last_volume, None)
+        last_set_volume = last_volume
+        last_vol_set_ns = now
 
-                # Visual volume bar
-                volBar = np.interp(length, [30, 250], [400, 150])
-                volPer = int(np.interp(length, [30, 250], [0, 100]))
-                cv2.rectangle(frame, (50, 150), (85, 400), (0, 255, 0), 3)  # Bar outline
-                cv2.rectangle(frame, (50, int(volBar)), (85, 400), (0, 255, 0), cv2.FILLED)  # Fill it
+    # Visual volume bar
+    if volume_gesture_active:
+        draw_volume_bar(frame, volBar)
 
     # Show temporary messages
-    if current_message and (current_time - message_start_time < message_duration):
-        cv2.putText(frame, current_message, (40, 70),
-                    cv2.FONT_HERSHEY_SIMPLEX, 1, (0, 255, 0), 2)  # Green text
+    if current_message and (now - message_start_time < message_duration):
+        blit_sprite(frame, MSG_SPRITES[current_message], 40, 70)  # Green text
     else:
         current_message = ""  # Clear message after timeout
 
     # Display volume percentage (the people demand numbers!)
-    cv2.putText(frame, f'Volume: {volPer}%', (40, 450),
-                cv2.FONT_HERSHEY_COMPLEX, 1, (0, 255, 0), 2)
+    blit_sprite(frame, VOL_SPRITES[volPer], 40, 450)
 
     # Show frame
     cv2.imshow("Music Player", frame)
 
     # Exit key (because even magic shows end) 🚪
-    if cv2.waitKey(1) & 0xFF == ord('q'):
+    remaining_ms = max(1, (frame_deadline - time.monotonic_ns()) // 1_000_000)
+    key = cv2.waitKey(remaining_ms) & 0xFF
+    if key == ord('q'):
         break  # "Goodbye cruel world!" 👋
+    if key == ord('s'):
+        show_skeleton = not show_skeleton  # Skeleton on/off
 
 # ===========================================
 # AFTER PARTY CLEANUP
 # ===========================================
+running.clear()  # Tell the helper threads to clock out
+capture_thread.join()
+hands.close()  # Shut down MediaPipe
 cap.release()  # Turn off camera (privacy first!)
 cv2.destroyAllWindows()  # Close all windows
 pygame.mixer.quit()  # Stop music
 
+if capture_error is not None:
+    raise capture_error  # The camera thread crashed, show what went wrong
+
 """
 Pro Tips:
 1. The 30-250 range in volume control? That's pixel distance!
@@ -331,7 +617,7 @@ Pro Tips:
    - 250px apart = Max volume
 2. Purple connection line? That's ✨ aesthetic ✨
 3. Message positions (40,70) and (40,450) = Top-left and bottom-left
-4. waitKey(1) = 1ms refresh rate 
+4. waitKey(remaining_ms) = Rest for what's left of the 33ms frame (at least 1ms) 
 
 Common Issues :
 - Hand not detected? Make sure: